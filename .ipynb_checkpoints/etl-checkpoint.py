@@ -51,7 +51,9 @@ def validate_airline_flights(data):
         bool: True if data is valid, False otherwise.
     """
     # Check numerical fields and convert where possible
-    data[['Revenue ($)', 'Distance (km)', 'Flight Number', 'Passengers (First Class)', 'Passengers (Business Class)', 'Passengers (Economy Class)']] = data[['Revenue ($)', 'Distance (km)', 'Flight Number', 'Passengers (First Class)', 'Passengers (Business Class)', 'Passengers (Economy Class)']].apply(pd.to_numeric, errors='coerce')
+    for col in ['Revenue ($)', 'Distance (km)', 'Flight Number', 'Passengers (First Class)', 'Passengers (Business Class)', 'Passengers (Economy Class)']:
+        if data[col].dtype.kind not in 'iuf':  # Columns parsed as numbers by read_csv need no conversion
+            data[col] = pd.to_numeric(data[col], errors='coerce')
     airline_missing = data.isnull().sum()
     
     # Count NaN data
@@ -75,7 +77,9 @@ def validate_stock_prices(data):
         bool: True if data is valid, False otherwise.
     """
     # Validate numerical fields, converting other data types in those fields to NaN
-    data[['open', 'high', 'low', 'close', 'adj_close', 'volume']] = data[['open', 'high', 'low', 'close', 'adj_close', 'volume']].apply(pd.to_numeric, errors='coerce')
+    for col in ['open', 'high', 'low', 'close', 'adj_close', 'volume']:
+        if data[col].dtype.kind not in 'iuf':  # Columns parsed as numbers by read_csv need no conversion
+            data[col] = pd.to_numeric(data[col], errors='coerce')
 
     # Check for missing values
     stock_missing = data.isnull().sum()
@@ -194,6 +198,14 @@ def data_processing_pipeline(filepath):
         print(f"--> Data validation failed for {filepath}")
          
             
-#Execute the ETL for the two datasets
-data_processing_pipeline("big_tech_stock_prices.txt")
-data_processing_pipeline("airline_flights.csv")
\ No newline at end of file
+def main():
+    """
+    Executes the ETL for the two datasets.
+    """
+    data_processing_pipeline("big_tech_stock_prices.txt")
+    data_processing_pipeline("airline_flights.csv")
+
+
+# Importing the module does not run the ETL
+if __name__ == "__main__":
+    main()
@@ -1,199 +1,420 @@
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+
+# Supported datasets, identified once per file from the columns
+DATASET_AIRLINE = 0
+DATASET_STOCK = 1
+
+# Columns that must hold numerical data in each dataset
+AIRLINE_NUMERIC_COLUMNS = ['Revenue ($)', 'Distance (km)', 'Flight Number', 'Passengers (First Class)', 'Passengers (Business Class)', 'Passengers (Economy Class)']
+STOCK_NUMERIC_COLUMNS = ['open', 'high', 'low', 'close', 'adj_close', 'volume']
+# Airline columns holding whole numbers. Flight numbers and passenger counts are small, so 32 bits halve their size
+AIRLINE_INTEGER_COLUMNS = ['Flight Number', 'Passengers (First Class)', 'Passengers (Business Class)', 'Passengers (Economy Class)']
+AIRLINE_INTEGER_DTYPE = np.int32
+# Airline string columns converted to upper case
+AIRLINE_UPPERCASE_COLUMNS = ['Origin', 'Destination', 'Departure Gate', 'Arrival Gate', 'Pod']
+# Low-cardinality airline string columns, read as categoricals so that each distinct value is stored and converted once
+AIRLINE_CATEGORICAL_COLUMNS = ['Origin', 'Destination', 'Departure Gate', 'Arrival Gate', 'Aircraft Type', 'Pod']
+CATEGORICAL_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+# Arrow types of the known columns of both datasets, so the CSV parser can skip type inference for them.
+# Columns missing from a file are ignored, so the types do not depend on the dataset being read.
+# The airline counts are stored as floats (e.g. 190.0) and may be missing, so they are read as float64
+READ_COLUMN_TYPES = {
+    'Date': pa.date32(),
+    'Departure Time': pa.string(),
+    **{col: pa.float64() for col in AIRLINE_NUMERIC_COLUMNS},
+    **{col: CATEGORICAL_TYPE for col in AIRLINE_CATEGORICAL_COLUMNS},
+    'stock_symbol': pa.string(),
+    'date': pa.date32(),
+    **{col: pa.float64() for col in ['open', 'high', 'low', 'close', 'adj_close']},
+    'volume': pa.int64(),
+}
+# Dates are kept as Arrow dates, which the CSV writer renders without a time of day
+DATE_DTYPE = pd.ArrowDtype(pa.date32())
+# Formats tried, in order, when dates have to be parsed from text
+DATE_FORMATS = ['%Y-%m-%d', '%m/%d/%Y']
+# Read types used when a numerical column holds non-numerical data: the other known columns are read as text instead
+TEXT_COLUMN_TYPES = {col: CATEGORICAL_TYPE if arrow_type == CATEGORICAL_TYPE else pa.string() for col, arrow_type in READ_COLUMN_TYPES.items()}
+
+# Bytes of the input file parsed per chunk. Only one chunk is held in memory at a time
+CHUNK_SIZE = 8 << 20
+# Buffer size of the output file, and rows serialized at a time by the CSV writer
+WRITE_BUFFER_SIZE = 1 << 20
+WRITE_BATCH_SIZE = 65536
+# Rows per Parquet row group, which is also the chunk size when reading Parquet files
+PARQUET_ROW_GROUP_SIZE = 128_000
+
+class ReadError(Exception):
+    """
+    Raised when the data file holds values that do not match the column types it is read with.
+    """
 
 # Step 1: Read the Data
-def read_data(filepath):
+def read_data(filepath, column_types=READ_COLUMN_TYPES):
     """
-    Reads data from a CSV or TXT file based on the file extension. Assuming a comma delimiter in both cases
+    Reads data from a CSV, TXT or Parquet file based on the file extension, chunk by chunk. Assuming a comma delimiter for CSV and TXT files
     Args:
         filepath (str): Path to the data file.
+        column_types (dict): Arrow types of the known columns. Parquet files already store their types.
 
     Returns:
-        pd.DataFrame: The loaded data as a DataFrame.
+        generator: The loaded data as DataFrames with pd.ArrowDtype and categorical columns, one per chunk.
+
+    Raises:
+        ReadError: If a value does not match its column type, when opening the file or reading a chunk.
     """
-    if filepath.endswith(".csv") or filepath.endswith(".txt"): # Read dataset if the end of the filepath is .csv or .txt
-        try:
-            data = pd.read_csv(filepath)
-            print('--> Opening', filepath)
-        except:
-            raise Exception("File not found.")  # Exception is raised when the file is not found
+    if not filepath.endswith((".csv", ".txt", ".parquet")):
+        raise Exception("Unsupported file format") # Exception is raised when the file format is not one of the supported ones.
+    if not os.path.isfile(filepath):
+        raise FileNotFoundError(filepath)  # Exception is raised when the file is not found
+
+    if filepath.endswith(".parquet"):
+        parquet_file = pq.ParquetFile(filepath)
+        schema = parquet_file.schema_arrow
+        reader = parquet_file.iter_batches(batch_size=PARQUET_ROW_GROUP_SIZE)
     else:
-        raise Exception("Unsupported file format") # Exception is raised when the file format is not one of the two supported.
-    return data
+        try:
+            reader = pv.open_csv(filepath, read_options=pv.ReadOptions(use_threads=True, block_size=CHUNK_SIZE),
+                                 convert_options=pv.ConvertOptions(column_types=column_types, strings_can_be_null=True))
+        except pa.ArrowInvalid as error:  # The first chunk is parsed when the file is opened
+            raise ReadError(str(error)) from error
+        schema = reader.schema
+    print('--> Opening', filepath)
+    return _iter_chunks(reader, schema)
+
+def _iter_chunks(reader, schema):
+    """
+    Converts the record batches of a reader to DataFrames.
+
+    Args:
+        reader (iterable): The record batches of the data file.
+        schema (pa.Schema): The schema of the data file.
+
+    Yields:
+        pd.DataFrame: The next chunk of data. A file without data rows yields one empty chunk, so that its header is still saved.
+    """
+    empty = True
+    try:
+        for batch in reader:
+            empty = False
+            yield batch.to_pandas(types_mapper=_pandas_dtype)
+    except pa.ArrowInvalid as error:  # Only errors of the reader: errors of the consumer are not raised inside the generator
+        raise ReadError(str(error)) from error
+    if empty:
+        yield schema.empty_table().to_pandas(types_mapper=_pandas_dtype)
 
-# Step 2: Data Validation
-def validate_data(data):
+def _pandas_dtype(arrow_type):
     """
-    Validates the data by checking missing values, outliers
+    Maps an Arrow type to the pandas dtype of the loaded column.
 
     Args:
-        data (pd.DataFrame): The data to be cleaned.
+        arrow_type (pa.DataType): The Arrow type of the column.
 
     Returns:
-        pd.DataFrame: The cleaned data.
+        pd.ArrowDtype: The Arrow-backed dtype, or None for dictionary columns, which pyarrow loads as categoricals.
+    """
+    if pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+# Step 2 & 3: Data Validation and Cleaning
+def classify_data(data):
+    """
+    Identifies the dataset from its columns.
+
+    Args:
+        data (pd.DataFrame): The data to be identified.
+
+    Returns:
+        int: DATASET_AIRLINE or DATASET_STOCK.
     """
     if "Airline" in data.columns:  # Assuming a column identifies the dataset
-        print('--> Validating')
-        return validate_airline_flights(data)
+        return DATASET_AIRLINE
     elif "stock_symbol" in data.columns:
-        print('--> Validating')
-        return validate_stock_prices(data)
+        return DATASET_STOCK
     else:
         raise Exception("Unsupported dataset")
 
-def validate_airline_flights(data):
+def validate_and_clean_data(data, kind, last_row=None):
     """
-    Validates the airline data to ensure it meets specific requirements.
+    Validates the data by checking missing values and cleans it by handling missing values and data type conversions.
+    Both steps share a single pass over the columns.
 
     Args:
-        data (pd.DataFrame): The data to be validated.
+        data (pd.DataFrame): The chunk of data to be validated and cleaned.
+        kind (int): The dataset, as returned by classify_data.
+        last_row (pd.Series): The last cleaned row of the previous chunk, if any.
 
     Returns:
-        bool: True if data is valid, False otherwise.
+        tuple: The cleaned data (pd.DataFrame), the missing value count per column (dict) and the number of rows with missing data (int).
     """
-    # Check numerical fields and convert where possible
-    data[['Revenue ($)', 'Distance (km)', 'Flight Number', 'Passengers (First Class)', 'Passengers (Business Class)', 'Passengers (Economy Class)']] = data[['Revenue ($)', 'Distance (km)', 'Flight Number', 'Passengers (First Class)', 'Passengers (Business Class)', 'Passengers (Economy Class)']].apply(pd.to_numeric, errors='coerce')
-    airline_missing = data.isnull().sum()
-    
-    # Count NaN data
-    row_nan_count = data.isnull().any(axis=1).sum()
-    
-    print('Total row count: ', len(data))
-    print('Rows with missing data', row_nan_count)
-    print('Missing values in airline data:\n', airline_missing)
-    if row_nan_count > (0.9*len(data)):
-        return False
-    return True
-    
-def validate_stock_prices(data):
+    # Copy-on-write lets derived frames share buffers with their parent until they are modified, so the cleaning
+    # steps do not need defensive copies. It is only enabled here, to leave the option of the caller untouched
+    with pd.option_context("mode.copy_on_write", True):
+        if kind == DATASET_AIRLINE:
+            return _validate_and_clean_airline(data)
+        elif kind == DATASET_STOCK:
+            return _validate_and_clean_stock(data, last_row)
+        else:
+            raise Exception("Unsupported dataset")
+
+def _count_missing(data, numeric_columns):
     """
-    Validates the stock data to ensure it meets specific requirements.
+    Converts the numerical fields, turning other data types into NaN, and counts missing values column by column.
 
     Args:
-        data (pd.DataFrame): The data to be validated.
+        data (pd.DataFrame): The data to be validated. Numerical fields are converted in place.
+        numeric_columns (list): Columns that must hold numerical data.
 
     Returns:
-        bool: True if data is valid, False otherwise.
+        tuple: Missing value count per column (dict) and a boolean mask of the rows with missing data (np.ndarray).
     """
-    # Validate numerical fields, converting other data types in those fields to NaN
-    data[['open', 'high', 'low', 'close', 'adj_close', 'volume']] = data[['open', 'high', 'low', 'close', 'adj_close', 'volume']].apply(pd.to_numeric, errors='coerce')
-
-    # Check for missing values
-    stock_missing = data.isnull().sum()
-    row_nan_count = data.isnull().any(axis=1).sum()
-    
-    print('Total row count: ', len(data))
-    print('Rows with missing data', row_nan_count)
-    print('Missing values in stock data:\n', stock_missing)
-    if row_nan_count > (0.9*len(data)):
-        return False
-    return True
-
+    missing = {}
+    mask = np.zeros(len(data), dtype=bool)
+    for col in data.columns:
+        if col in numeric_columns and data[col].dtype.kind not in 'iuf':
+            # Only reached when the reader could not parse the column as numbers. Converting from Python objects
+            # turns the bad values into missing values rather than into non-missing NaN in an Arrow float column.
+            # The inferred type may differ between chunks, so the column is cast to its declared type
+            data[col] = pd.to_numeric(data[col].astype(object), errors='coerce', dtype_backend='pyarrow').astype(
+                pd.ArrowDtype(READ_COLUMN_TYPES[col]))
+        values = pa.array(data[col])
+        missing[col] = values.null_count  # Arrow keeps the null count of each column, so counting needs no scan
+        if values.null_count:
+            # Accumulate rows with missing data without a temporary frame, only for the columns that have any
+            np.logical_or(mask, values.is_null().to_numpy(zero_copy_only=False), out=mask)
+    return missing, mask
 
-#Step 3: Data Cleaning
-def clean_data(data):
+def _validate_and_clean_airline(data):
     """
-    Cleans the data by handling missing values, outliers, and data type conversions.
+    Validates and cleans the airline flights dataset.
 
     Args:
-        data (pd.DataFrame): The data to be cleaned.
+        data (pd.DataFrame): The airline flights data to be validated and cleaned.
 
     Returns:
-        pd.DataFrame: The cleaned data.
+        tuple: The cleaned airline flights data (pd.DataFrame), the missing value count per column (dict) and the number of rows with missing data (int).
     """
-    if "Airline" in data.columns:  # Assuming a column identifies the dataset
-        print('--> Cleaning')
-        return clean_airline_flights(data)
-    elif "stock_symbol" in data.columns:
-        print('--> Cleaning')
-        return clean_stock_prices(data)
-    else:
-        raise Exception("Unsupported dataset")
+    missing, mask = _count_missing(data, AIRLINE_NUMERIC_COLUMNS)
 
+    # Remove NaN data (the boolean selection already returns a new frame, so no copy is needed)
+    clean_data = data.loc[~mask]
+    
+    # Convert data types
+    clean_data['Date'] = _parse_dates(clean_data['Date'])
+    limits = np.iinfo(AIRLINE_INTEGER_DTYPE)
+    for col in AIRLINE_INTEGER_COLUMNS:
+        column = clean_data[col]
+        if column.dtype.kind not in 'iu':  # Already integers, of any width, when cleaned Parquet data is read back
+            # Values outside of the narrow integer range would wrap around, so such columns are kept as int64
+            in_range = column.empty or (limits.min <= column.min() and column.max() <= limits.max)
+            clean_data[col] = column.astype(AIRLINE_INTEGER_DTYPE if in_range else np.int64, errors='ignore', copy=False)
+    for col in AIRLINE_UPPERCASE_COLUMNS:
+        # Only the distinct values of the categorical column are converted, and the column is left as it is if
+        # they are already upper case
+        column = clean_data[col].astype('category')  # No-op unless the data was not read from a CSV or TXT file
+        categories = column.cat.categories
+        upper_categories = categories.str.upper()
+        if not upper_categories.equals(categories):
+            codes, unique_categories = pd.factorize(upper_categories)  # Merges values that only differed in case
+            # Missing values have code -1, which would otherwise index the last category. Rows with missing values
+            # are removed above, so this only guards against changes to that step
+            clean_data[col] = pd.Categorical.from_codes(np.where(column.cat.codes < 0, -1, codes[column.cat.codes]), unique_categories)
+    return clean_data, missing, np.count_nonzero(mask)
 
-def clean_airline_flights(data):
+def _validate_and_clean_stock(data, last_row=None):
     """
-    Cleans the airline flights dataset.
+    Validates and cleans the big tech stock prices dataset.
 
     Args:
-        data (pd.DataFrame): The airline flights data to be cleaned.
+        data (pd.DataFrame): The stock prices data to be validated and cleaned.
+        last_row (pd.Series): The last cleaned row of the previous chunk, if any.
 
     Returns:
-        pd.DataFrame: The cleaned airline flights data.
+        tuple: The cleaned stock prices data (pd.DataFrame), the missing value count per column (dict) and the number of rows with missing data (int).
     """
-    clean_data = data.copy()
-    # Remove NaN data
-    clean_data = clean_data.dropna()
-    
+    missing, mask = _count_missing(data, STOCK_NUMERIC_COLUMNS)
+
+    # Handling Missing Values (ffill already returns a new frame, so no copy is needed)
+    clean_data = data.ffill()  # Forward-fill to propagate last valid observation
+    if last_row is not None:
+        clean_data.fillna(last_row.to_dict(), inplace=True)  # Carry the last observation of the previous chunk into this one
+    # Only rows before the first observation of a price can still be missing it, so the numerical fields are only
+    # checked for missing values when the first row is incomplete
+    if clean_data[STOCK_NUMERIC_COLUMNS].iloc[:1].isna().any(axis=None):
+        clean_data = clean_data.dropna(subset=STOCK_NUMERIC_COLUMNS)
+
     # Convert data types
-    try:
-        clean_data['Date'] = pd.to_datetime(clean_data['Date'])
-        clean_data[['Revenue ($)', 'Distance (km)']] = clean_data[['Revenue ($)', 'Distance (km)']].astype(float)
-        clean_data[['Flight Number','Passengers (First Class)', 'Passengers (Business Class)', 'Passengers (Economy Class)']] = clean_data[['Flight Number','Passengers (First Class)', 'Passengers (Business Class)', 'Passengers (Economy Class)']].astype(int, errors='ignore')
-        clean_data['Origin'] = clean_data['Origin'].str.upper()  # Assuming origin is a string column
-        clean_data['Destination'] = clean_data['Destination'].str.upper()  # Assuming destination is a string column
-        clean_data['Departure Gate'] = clean_data['Departure Gate'].str.upper()  # Assuming aircraft type is a string column
-        clean_data['Arrival Gate'] = clean_data['Arrival Gate'].str.upper()  # Assuming aircraft type is a string column
-        clean_data['Aircraft Type'] = clean_data['Aircraft Type'].astype(str)
-        clean_data['Pod'] = clean_data['Pod'].str.upper() 
-    except:
-        raise Exception("One or more columns may have incorrectly formatted data.")
-    return clean_data
-
-def clean_stock_prices(data):
-    """ Cleans the big tech stock prices dataset.
+    clean_data['date'] = _parse_dates(clean_data['date'])
+    return clean_data, missing, np.count_nonzero(mask)
+
+def _parse_dates(column):
+    """
+    Converts a date column to Arrow dates. Columns the reader already parsed as dates are returned as they are.
 
     Args:
-        data (pd.DataFrame): The stock prices data to be cleaned.
+        column (pd.Series): The date column.
 
     Returns:
-        pd.DataFrame: The cleaned stock prices data.
+        pd.Series: The column with the DATE_DTYPE dtype.
     """
-    clean_data = data.copy()
-    # Handling Missing Values
-    clean_data.fillna(method='ffill', inplace=True)  # Forward-fill to propagate last valid observation
-
-    # Convert data types
-    clean_data['date'] = pd.to_datetime(clean_data['date'])
-    clean_data[['open', 'high', 'low', 'close', 'adj_close']] = clean_data[['open', 'high', 'low', 'close', 'adj_close']].astype(float)
-    clean_data['volume'] = clean_data['volume'].astype(int) 
-    return clean_data
+    if column.dtype == DATE_DTYPE:  # Only parsed here when the file was read as text
+        return column
+    # Probe the first date once, so that all dates are parsed with an explicit format rather than an inferred one
+    date_format = None
+    first_index = column.first_valid_index()
+    for candidate in DATE_FORMATS:
+        try:
+            datetime.strptime(column[first_index], candidate)
+        except (KeyError, TypeError, ValueError):
+            continue
+        date_format = candidate
+        break
+    # The cache converts each distinct date once, as the same dates repeat across rows
+    return pd.to_datetime(column, format=date_format, cache=True).astype(DATE_DTYPE)
 
 
 # Step 4: Save data
-def save_data(data, filepath):
+def save_data(data, file, header=True):
     """
-    Saves the data to a CSV format.
+    Saves the data to a CSV format with the multithreaded PyArrow CSV writer, or to a Parquet format.
 
     Args:
       data (pd.DataFrame): The data to be saved.
-      filepath (str): Path to the output file.
+      file (str, file object or pq.ParquetWriter): Path to the output file, saved as Parquet if it ends with .parquet
+        and as CSV otherwise, an open binary file to append CSV data to, or a Parquet writer to append a row group to.
+      header (bool): Whether to write the column names. Only used for CSV.
     """
-    try:
-        data.to_csv(filepath, index=False) # Save data to CSV
-        print('--> Saving data')
-    except:
-        raise Exception("Cannot save data to CSV")
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    if isinstance(file, pq.ParquetWriter):
+        file.write_table(table.cast(file.schema), row_group_size=PARQUET_ROW_GROUP_SIZE) # Save data to Parquet
+    elif isinstance(file, str) and file.endswith(".parquet"):
+        pq.write_table(table, file, row_group_size=PARQUET_ROW_GROUP_SIZE, compression='zstd') # Save data to Parquet
+    else:
+        pv.write_csv(table, file, write_options=pv.WriteOptions(include_header=header, batch_size=WRITE_BATCH_SIZE)) # Save data to CSV
+
+def _open_writer(data, out, output_path):
+    """
+    Opens the writer used by save_data for the output file, based on its extension.
+
+    Args:
+      data (pd.DataFrame): The first chunk of data to be saved, which sets the Parquet schema.
+      out (file object): The open binary output file.
+      output_path (str): Path to the output file.
+
+    Returns:
+      file object or pq.ParquetWriter: out for CSV and TXT files, or a Parquet writer around it.
+    """
+    if output_path.endswith(".parquet"):
+        # Parquet keeps the column types, so reading the cleaned data back needs no parsing or type inference.
+        # The repeated strings of the airline data are dictionary encoded
+        schema = pa.Schema.from_pandas(data, preserve_index=False)
+        # Categorical codes may need a wider integer type in later chunks, and so may the integer columns, which are
+        # only narrowed for the chunks whose values fit
+        fields = [field.with_type(pa.dictionary(pa.int32(), field.type.value_type)) if pa.types.is_dictionary(field.type)
+                  else field.with_type(pa.int64()) if field.name in AIRLINE_INTEGER_COLUMNS
+                  else field
+                  for field in schema]
+        return pq.ParquetWriter(out, pa.schema(fields, metadata=schema.metadata), compression='zstd')
+    return out
         
         
 # Define the data processing pipeline steps
-def data_processing_pipeline(filepath):
+def data_processing_pipeline(filepath, output_path=None):
     """
     Performs the data processing pipeline steps: read, validate, clean and save.
+    The file is processed chunk by chunk, so memory use does not grow with the file size.
 
     Args:
         filepath (str): Path to the data file.
+        output_path (str): Path to the output file. The data is saved as Parquet if it ends with .parquet.
+            Defaults to the data file name prefixed with cleaned_.
             
     """
-    data = read_data(filepath)    # Step 1: Read data
-    validated_data = validate_data(data) # Step 2: Validate data
-    if validated_data: 
-        cleaned_data = clean_data(data) # Step 3: Clean data
-        save_data(cleaned_data, "cleaned_" + filepath) # Step 4: Save data
-        print(f"--> Saved data at cleaned_{filepath}")
+    if output_path is None:
+        output_path = "cleaned_" + filepath
+    # The data is saved to a temporary file next to the output, with the same extension, as validation is only
+    # complete once the whole file was processed. An existing output is only replaced by valid data
+    root, extension = os.path.splitext(output_path)
+    temp_path = root + ".tmp" + extension
+    try:
+        try:
+            validated = _process_chunks(filepath, temp_path, READ_COLUMN_TYPES)
+        except ReadError:
+            # A typed column holds non-numerical data: start over with the known columns read as text,
+            # so that validation can turn those values into NaN
+            validated = _process_chunks(filepath, temp_path, TEXT_COLUMN_TYPES)
+        if validated:
+            os.replace(temp_path, output_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)  # Only valid data is kept
+    if validated:
+        print(f"--> Saved data at {output_path}")
     else:
         print(f"--> Data validation failed for {filepath}")
+
+def _process_chunks(filepath, output_path, column_types):
+    """
+    Reads, validates, cleans and saves a file chunk by chunk, keeping the validation totals of the whole file.
+
+    Args:
+        filepath (str): Path to the data file.
+        output_path (str): Path to the output file.
+        column_types (dict): Arrow types of the known columns.
+
+    Returns:
+        bool: True if the data is valid, False otherwise.
+    """
+    row_count = 0
+    row_nan_count = 0
+    missing = Counter()
+    last_row = None
+    chunks = read_data(filepath, column_types)    # Step 1: Read data
+    print('--> Validating, cleaning and saving data')
+    with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as out:
+        writer = None
+        try:
+            for i, data in enumerate(chunks):
+                if i == 0:
+                    kind = classify_data(data)  # All chunks share the columns of the first one
+                cleaned_data, chunk_missing, chunk_nan_count = validate_and_clean_data(data, kind, last_row) # Step 2 & 3: Validate and clean data
+                if writer is None:
+                    writer = _open_writer(cleaned_data, out, output_path)
+                save_data(cleaned_data, writer, header=(i == 0)) # Step 4: Save data
+                row_count += len(data)
+                row_nan_count += chunk_nan_count
+                missing.update(chunk_missing)
+                if len(cleaned_data):
+                    last_row = cleaned_data.iloc[-1]
+        finally:
+            if isinstance(writer, pq.ParquetWriter):
+                writer.close()  # Writes the Parquet footer, and is also needed on errors, before the output file is closed
+
+    # Printed at once, so that the summaries of files processed in parallel do not interleave
+    print(f'Total row count:  {row_count}\n'
+          f'Rows with missing data {row_nan_count}\n'
+          f'Missing values in {filepath}:\n {pd.Series(missing)}')
+    return row_nan_count <= (0.9*row_count)
          
             
-#Execute the ETL for the two datasets
-data_processing_pipeline("big_tech_stock_prices.txt")
-data_processing_pipeline("airline_flights.csv")
\ No newline at end of file
+def main():
+    """
+    Executes the ETL for the two datasets, in parallel as they share no state.
+    """
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        list(executor.map(data_processing_pipeline, ["big_tech_stock_prices.txt", "airline_flights.csv"]))  # Raises any error from the workers
+
+
+# Importing the module, as worker processes and test runners do, does not run the ETL
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+import pytest
+
+import etl
+
+AIRLINE_HEADER = "Date,Departure Time,Revenue ($),Passengers (First Class),Passengers (Business Class),Passengers (Economy Class),Origin,Destination,Pod,Distance (km),Flight Number,Aircraft Type,Departure Gate,Arrival Gate,Airline\n"
+FLIGHT_ROW = "2023-06-19,01:37,2393.0,1.0,13.0,190.0,LHR,SIN,A,1090.0,279.0,Boeing 737,D,D,American Airlines\n"
+STOCK_HEADER = "stock_symbol,date,open,high,low,close,adj_close,volume\n"
+STOCK_ROW = "AAPL,2010-01-04,7.62,7.66,7.58,7.64,6.52,493729600\n"
+
+
+def test_header_only_csv_keeps_header(tmp_path):
+    input_path = tmp_path / "header.csv"
+    input_path.write_text(AIRLINE_HEADER)
+    output_path = tmp_path / "cleaned_header.csv"
+
+    etl.data_processing_pipeline(str(input_path), str(output_path))
+
+    table = pv.read_csv(output_path)
+    assert table.num_rows == 0
+    assert ",".join(table.column_names) + "\n" == AIRLINE_HEADER
+
+
+def test_header_only_parquet_output_is_readable(tmp_path):
+    input_path = tmp_path / "header.csv"
+    input_path.write_text(AIRLINE_HEADER)
+    output_path = tmp_path / "header.parquet"
+
+    etl.data_processing_pipeline(str(input_path), str(output_path))
+
+    table = pq.read_table(output_path)
+    assert table.num_rows == 0
+    assert ",".join(table.column_names) + "\n" == AIRLINE_HEADER
+
+
+def test_save_errors_are_not_retried_as_text(tmp_path, monkeypatch):
+    input_path = tmp_path / "flights.csv"
+    input_path.write_text(AIRLINE_HEADER + FLIGHT_ROW)
+
+    def failing_save(data, file, header=True):
+        raise pa.ArrowInvalid("cannot cast")
+
+    monkeypatch.setattr(etl, "save_data", failing_save)
+    with pytest.raises(pa.ArrowInvalid):
+        etl.data_processing_pipeline(str(input_path), str(tmp_path / "cleaned_flights.csv"))
+
+
+def test_integers_outside_int32_are_not_wrapped(tmp_path):
+    input_path = tmp_path / "flights.csv"
+    input_path.write_text(AIRLINE_HEADER + FLIGHT_ROW.replace("279.0", "3000000000.0"))
+    output_path = tmp_path / "cleaned_flights.csv"
+
+    etl.data_processing_pipeline(str(input_path), str(output_path))
+
+    assert pv.read_csv(output_path)["Flight Number"].to_pylist() == [3000000000]
+
+
+def test_integers_outside_int32_in_a_later_chunk_are_saved_to_parquet(tmp_path, monkeypatch):
+    monkeypatch.setattr(etl, "CHUNK_SIZE", 400)
+    input_path = tmp_path / "flights.csv"
+    input_path.write_text(AIRLINE_HEADER + FLIGHT_ROW * 5 + FLIGHT_ROW.replace("279.0", "3000000000.0"))
+    output_path = tmp_path / "cleaned_flights.parquet"
+    assert len(list(etl.read_data(str(input_path)))) > 1
+
+    etl.data_processing_pipeline(str(input_path), str(output_path))
+
+    assert pq.read_table(output_path)["Flight Number"].to_pylist() == [279] * 5 + [3000000000]
+
+
+def test_text_fallback_keeps_numeric_types_across_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(etl, "CHUNK_SIZE", 400)
+    input_path = tmp_path / "flights.csv"
+    input_path.write_text(AIRLINE_HEADER + FLIGHT_ROW.replace("2393.0", "2393") * 5
+                          + FLIGHT_ROW.replace("2393.0", "2393.5") * 5 + FLIGHT_ROW.replace("2393.0", "abc"))
+    output_path = tmp_path / "cleaned_flights.parquet"
+
+    etl.data_processing_pipeline(str(input_path), str(output_path))
+
+    assert pq.read_table(output_path)["Revenue ($)"].to_pylist() == [2393.0] * 5 + [2393.5] * 5
+
+
+@pytest.mark.filterwarnings("error::pytest.PytestUnraisableExceptionWarning")
+def test_parquet_writer_is_closed_when_a_later_chunk_fails(tmp_path, monkeypatch):
+    monkeypatch.setattr(etl, "CHUNK_SIZE", 400)
+    input_path = tmp_path / "flights.csv"
+    input_path.write_text(AIRLINE_HEADER + FLIGHT_ROW * 5 + FLIGHT_ROW.replace("2393.0", "abc"))
+    output_path = tmp_path / "cleaned_flights.parquet"
+
+    etl.data_processing_pipeline(str(input_path), str(output_path))
+
+    assert pq.read_table(output_path).num_rows == 5
+
+
+def test_save_data_writes_parquet_paths_as_parquet(tmp_path):
+    output_path = tmp_path / "data.parquet"
+
+    etl.save_data(pd.DataFrame({"a": [1, 2]}), str(output_path))
+
+    assert pq.read_table(output_path)["a"].to_pylist() == [1, 2]
+
+
+def test_integer_columns_read_back_from_parquet_are_not_cast(tmp_path):
+    input_path = tmp_path / "flights.csv"
+    input_path.write_text(AIRLINE_HEADER + FLIGHT_ROW)
+    parquet_path = tmp_path / "cleaned_flights.parquet"
+    etl.data_processing_pipeline(str(input_path), str(parquet_path))
+
+    data = next(etl.read_data(str(parquet_path)))
+    cleaned_data, _, _ = etl.validate_and_clean_data(data, etl.DATASET_AIRLINE)
+
+    for col in etl.AIRLINE_INTEGER_COLUMNS:
+        assert cleaned_data[col].dtype == data[col].dtype
+
+
+def test_failed_validation_keeps_previous_output(tmp_path):
+    input_path = tmp_path / "flights.csv"
+    input_path.write_text(AIRLINE_HEADER + FLIGHT_ROW.replace("2393.0", ""))
+    output_path = tmp_path / "cleaned_flights.csv"
+    output_path.write_text("previous output\n")
+
+    etl.data_processing_pipeline(str(input_path), str(output_path))
+
+    assert output_path.read_text() == "previous output\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["cleaned_flights.csv", "flights.csv"]
+
+
+def test_stock_forward_fill_carries_into_later_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(etl, "CHUNK_SIZE", 200)
+    input_path = tmp_path / "prices.txt"
+    input_path.write_text(STOCK_HEADER + STOCK_ROW + STOCK_ROW.replace("7.64", "") * 9)
+    output_path = tmp_path / "cleaned_prices.txt"
+    chunks = list(etl.read_data(str(input_path)))
+    assert len(chunks) > 1 and chunks[-1]["close"].isna().all()
+
+    etl.data_processing_pipeline(str(input_path), str(output_path))
+
+    assert pv.read_csv(output_path)["close"].to_pylist() == [7.64] * 10
+
+
+def test_missing_data_threshold_applies_to_the_whole_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(etl, "CHUNK_SIZE", 400)
+    bad_row = FLIGHT_ROW.replace("2393.0", "")
+    valid_path = tmp_path / "valid.csv"
+    valid_path.write_text(AIRLINE_HEADER + bad_row * 4 + FLIGHT_ROW * 6)
+    invalid_path = tmp_path / "invalid.csv"
+    invalid_path.write_text(AIRLINE_HEADER + bad_row * 19 + FLIGHT_ROW)
+    # A chunk only holding missing data, or mostly valid data, would give the opposite result on its own
+    assert next(etl.read_data(str(valid_path)))["Revenue ($)"].isna().all()
+    assert list(etl.read_data(str(invalid_path)))[-1]["Revenue ($)"].notna().any()
+
+    etl.data_processing_pipeline(str(valid_path), str(tmp_path / "cleaned_valid.csv"))
+    etl.data_processing_pipeline(str(invalid_path), str(tmp_path / "cleaned_invalid.csv"))
+
+    assert pv.read_csv(tmp_path / "cleaned_valid.csv").num_rows == 6
+    assert not (tmp_path / "cleaned_invalid.csv").exists()
+
+
+def test_categories_differing_in_case_are_merged(tmp_path):
+    input_path = tmp_path / "flights.csv"
+    input_path.write_text(AIRLINE_HEADER + FLIGHT_ROW.replace(",LHR,", ",lhr,") + FLIGHT_ROW)
+    output_path = tmp_path / "cleaned_flights.parquet"
+
+    etl.data_processing_pipeline(str(input_path), str(output_path))
+
+    origin = pq.read_table(output_path)["Origin"].combine_chunks()
+    assert origin.to_pylist() == ["LHR", "LHR"]
+    assert origin.dictionary.to_pylist() == ["LHR"]
+
+
+def test_text_fallback_parses_month_first_dates(tmp_path):
+    input_path = tmp_path / "flights.csv"
+    input_path.write_text(AIRLINE_HEADER + FLIGHT_ROW.replace("2023-06-19", "06/19/2023")
+                          + FLIGHT_ROW.replace("2023-06-19", "06/20/2023").replace("2393.0", "abc"))
+    output_path = tmp_path / "cleaned_flights.parquet"
+
+    etl.data_processing_pipeline(str(input_path), str(output_path))
+
+    table = pq.read_table(output_path)
+    assert table.schema.field("Date").type == pa.date32()
+    assert table["Date"].to_pylist() == [datetime.date(2023, 6, 19)]